@@ -0,0 +1,25 @@
+import logging
+import os
+
+import fastf1  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+_CACHE_ENABLED = False
+
+
+def ensure_cache(path: str = None) -> None:
+    """
+    Enables the FastF1 on-disk cache once per process.
+    FastF1 expects the cache to be configured a single time, so repeated calls are no-ops.
+    :param path: Cache directory, defaults to the FASTF1_CACHE_DIR env var or 'cache'
+    """
+    global _CACHE_ENABLED
+    if _CACHE_ENABLED:
+        return
+    if path is None:
+        path = os.environ.get('FASTF1_CACHE_DIR', 'cache')
+    os.makedirs(path, exist_ok=True)
+    fastf1.Cache.enable_cache(path)
+    _CACHE_ENABLED = True
+    logger.info(f"FastF1 cache enabled at {path}")
@@ -1,37 +1,93 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 import logging
 from typing import Any, Optional
 import fastf1  # type: ignore
 import pandas as pd
 
+from ._fastf1_setup import ensure_cache
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _get_loaded_session(year: int, round_number: int, session_identifier: str,
+                        load_items: tuple) -> Any:
+    """
+    Loads a FastF1 session and memoizes it per process, so analyzers created
+    for the same session share one object instead of re-parsing the on-disk
+    cache. Cached sessions are shared and must be treated as read-only.
+    :param load_items: session.load() keyword arguments as sorted (key, value) pairs
+    :return: Loaded FastF1 session
+    """
+    ensure_cache()
+    session = fastf1.get_session(year, round_number, session_identifier)
+    session.load(**dict(load_items))
+    return session
+
+
 class BaseAnalyzer(ABC):
     """BaseAnalyzer is an abstract class defining interface for all performance analyzers"""
-    def __init__(self, identifier: str, year: int, round_number: int, session_identifier: str) -> None:
+    __slots__ = ('identifier', 'year', 'round_number', 'session_identifier', 'load_kwargs',
+                 'session', '_driver_idx', '_team_idx')
+
+    #: Analyzers in this package only consume session.laps, so telemetry,
+    #: weather and race-control messages are skipped by default.
+    DEFAULT_LOAD_KWARGS = {'laps': True, 'telemetry': False, 'weather': False, 'messages': False}
+
+    def __init__(self, identifier: str, year: int, round_number: int, session_identifier: str,
+                 load_kwargs: Optional[dict] = None) -> None:
         """
         Initialize general analyzer for selected year and round number
         :param identifier: Three letter identifier of team or driver, depending on the analysis type
         :param year: Year of the season, e.g. 2024
         :param round_number: Ordinal number of the race (1 = first race of the season)
+        :param load_kwargs: Keyword arguments for session.load(), defaults to laps only
         """
         self.identifier = identifier
         self.year = year
         self.round_number = round_number
         self.session_identifier = session_identifier
+        self.load_kwargs = dict(self.DEFAULT_LOAD_KWARGS if load_kwargs is None else load_kwargs)
         self.session: Optional[pd.DataFrame] = None
+        self._driver_idx: Optional[dict] = None
+        self._team_idx: Optional[dict] = None
 
     def load_session(self) -> None:
         """
         Loads the session data using FastF1 for the specified session.
         """
         logger.info(f"Loading session data for year {self.year}, round {self.round_number}")
-        self.session = fastf1.get_session(self.year, self.round_number, self.session_identifier)
+        self.session = _get_loaded_session(self.year, self.round_number, self.session_identifier,
+                                           tuple(sorted(self.load_kwargs.items())))
         assert self.session is not None
-        self.session.load()
+        self._driver_idx = None
+        self._team_idx = None
         logger.info(f"Data loaded for session year {self.year}, round {self.round_number}")
 
+    def _laps_for_driver(self, driver_code: str) -> pd.DataFrame:
+        """
+        Returns all laps of one driver using a lazily built groupby index,
+        so repeated lookups avoid re-scanning the whole laps DataFrame.
+        :param driver_code: Three letter code of a driver, e.g. "VER"
+        :return: Laps of the given driver (empty if the driver is not in the session)
+        """
+        assert self.session is not None
+        if self._driver_idx is None:
+            self._driver_idx = self.session.laps.groupby('Driver', sort=False).indices
+        return self.session.laps.iloc[self._driver_idx.get(driver_code, [])]
+
+    def _laps_for_team(self, team_code: str) -> pd.DataFrame:
+        """
+        Returns all laps of one team using a lazily built groupby index.
+        :param team_code: Team name as it appears in the laps data
+        :return: Laps of the given team (empty if the team is not in the session)
+        """
+        assert self.session is not None
+        if self._team_idx is None:
+            self._team_idx = self.session.laps.groupby('Team', sort=False).indices
+        return self.session.laps.iloc[self._team_idx.get(team_code, [])]
+
     @staticmethod
     def validate_driver_code(code: str) -> bool:
         return len(code) == 3 and code.isalpha()
@@ -1,10 +1,11 @@
-from typing import Optional, TypedDict
+from typing import Optional
 import logging
 
+import numpy as np
 import pandas as pd
 
-from time_based_analyzer import TimeBasedAnalyzer, AnalyzeResult
-import fastf1  # type: ignore
+from .base_analyzer import _get_loaded_session
+from .time_based_analyzer import TimeBasedAnalyzer, AnalyzeResult
 
 logger = logging.getLogger(__name__)
 
@@ -14,15 +15,18 @@ class DriverTimeBasedAnalyzer(TimeBasedAnalyzer):
     Analyzer for specific driver. Allows to read data from FastF1 for selected season and race
     and perform time analysis
     """
+    __slots__ = ()
 
-    def __init__(self, driver_code: str, year: int, round_number: int, session_identifier: str) -> None:
+    def __init__(self, driver_code: str, year: int, round_number: int, session_identifier: str,
+                 load_kwargs: Optional[dict] = None) -> None:
         """
         Initialize analyzer for specific driver
         :param driver_code: Three letter code of a driver, e.g. "VER" or "HAM"
         :param year: Year of the season, e.g. 2024
         :param round_number: Ordinal number of the race (1 = first race of the season)
+        :param load_kwargs: Keyword arguments for session.load(), defaults to laps only
         """
-        super().__init__(driver_code, year, round_number, session_identifier)
+        super().__init__(driver_code, year, round_number, session_identifier, load_kwargs)
 
     def load_data(self) -> None:
         """
@@ -31,7 +35,7 @@ class DriverTimeBasedAnalyzer(TimeBasedAnalyzer):
         self.load_session()
         logger.info(f"Loading data for {self.identifier}, {self.year} round {self.round_number}")
         assert self.session is not None
-        self.laps = self.session.laps.pick_drivers(self.identifier)
+        self._set_laps(self._laps_for_driver(self.identifier))
         logger.info(f"Data loaded for {self.identifier}. Found {len(self.laps)} laps.")
 
     def compare_lap_times(self, other_driver: str = None, stint: int = None):
@@ -42,24 +46,31 @@ class DriverTimeBasedAnalyzer(TimeBasedAnalyzer):
         :return: DataFrame containing lap number, first (driver/team) lap time, second (driver/team) lap time,
         difference between their lap times
         """
+        driver_laps = self.laps
         if other_driver:
-            other_driver_laps = self.session.laps.pick_drivers(other_driver)
+            other_driver_laps = self._laps_for_driver(other_driver)
         else:
-            other_driver_laps = self.laps
+            other_driver_laps = driver_laps
 
-        if stint:
-            self.laps = self.laps[self.laps['Stint'] == stint]
-            other_driver_laps = other_driver_laps[other_driver_laps['Stint'] == stint]
+        if stint is not None:
+            driver_laps = driver_laps[driver_laps['Stint'].values == stint]
+            other_driver_laps = other_driver_laps[other_driver_laps['Stint'].values == stint]
 
-        comparison = pd.DataFrame({
-            "LapNumber": self.laps['LapNumber'],
-            "Driver1_LapTime": self.laps['LapTime'].dt.total_seconds(),
-            "Driver2_LapTime": other_driver_laps['LapTime'].dt.total_seconds()
-        })
+        merged = pd.merge(
+            driver_laps[['LapNumber', 'LapTime']],
+            other_driver_laps[['LapNumber', 'LapTime']],
+            on='LapNumber', how='inner', suffixes=('_1', '_2'), sort=False, copy=False
+        )
 
-        comparison['LapTimeDifference'] = comparison['Driver1_LapTime'] - comparison['Driver2_LapTime']
+        driver1_times = self._to_seconds(merged['LapTime_1'])
+        driver2_times = self._to_seconds(merged['LapTime_2'])
 
-        return comparison
+        return pd.DataFrame({
+            "LapNumber": merged['LapNumber'].to_numpy(),
+            "Driver1_LapTime": driver1_times,
+            "Driver2_LapTime": driver2_times,
+            "LapTimeDifference": driver1_times - driver2_times
+        }, copy=False)
 
     def analyze(self) -> AnalyzeResult:
         """
@@ -68,3 +79,33 @@ class DriverTimeBasedAnalyzer(TimeBasedAnalyzer):
         """
         return super().analyze()
 
+    @classmethod
+    def analyze_all(cls, year: int, round_number: int, session_identifier: str) -> dict:
+        """
+        Analyzes every driver of a session at once. The laps are grouped by
+        driver in a single pass instead of re-filtering the session per
+        driver, so this is the cheap way to summarize the whole field.
+        :param year: Year of the season, e.g. 2024
+        :param round_number: Ordinal number of the race (1 = first race of the season)
+        :param session_identifier: Session to analyze, e.g. "R"
+        :return: Dictionary mapping driver code to its analysis result
+        """
+        session = _get_loaded_session(year, round_number, session_identifier,
+                                      tuple(sorted(cls.DEFAULT_LOAD_KWARGS.items())))
+        lap_seconds = cls._to_seconds(session.laps['LapTime'])
+
+        results: dict = {}
+        for driver, indices in session.laps.groupby('Driver', sort=False).indices.items():
+            driver_seconds = lap_seconds[indices]
+            driver_seconds = driver_seconds[~np.isnan(driver_seconds)]
+            clean_lap_times = cls.filter_lap_outliers(driver_seconds)
+            results[driver] = {
+                "identifier": driver,
+                "year": year,
+                "round": round_number,
+                "average_lap_time": float(np.median(clean_lap_times)) if clean_lap_times.size else np.nan,
+                "fastest_lap": float(driver_seconds.min()) if driver_seconds.size else np.nan,
+                "lap_time_variance": float(np.var(clean_lap_times, ddof=1)) if clean_lap_times.size > 1 else np.nan
+            }
+        return results
+
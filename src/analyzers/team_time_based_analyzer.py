@@ -1,6 +1,6 @@
-from typing import Any, TypedDict
+from typing import Optional
 
-from time_based_analyzer import TimeBasedAnalyzer, AnalyzeResult
+from .time_based_analyzer import TimeBasedAnalyzer, AnalyzeResult
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,15 +10,17 @@ class TeamAnalyzer(TimeBasedAnalyzer):
     """
     Class for analyzing data for an entire team.
     """
+    __slots__ = ()
 
-    def __init__(self, team_code: str, year: int, round_number: int, session_identifier: str):
-        super().__init__(team_code, year, round_number, session_identifier)
+    def __init__(self, team_code: str, year: int, round_number: int, session_identifier: str,
+                 load_kwargs: Optional[dict] = None):
+        super().__init__(team_code, year, round_number, session_identifier, load_kwargs)
 
     def load_data(self) -> None:
         super().load_data()
         logger.info(f"Loading data for team {self.identifier}, {self.year} round {self.round_number}")
         assert self.session is not None
-        self.laps = self.session.laps.pick_teams(self.identifier)
+        self._set_laps(self._laps_for_team(self.identifier))
         logger.info(f"Data loaded for {self.identifier}. Found {len(self.laps)} laps.")
 
     def analyze(self) -> AnalyzeResult:
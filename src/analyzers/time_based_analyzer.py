@@ -3,7 +3,6 @@ from abc import abstractmethod
 import pandas as pd
 import numpy as np
 import logging
-import matplotlib.pyplot as plt
 
 from .base_analyzer import BaseAnalyzer
 
@@ -23,9 +22,14 @@ class TimeBasedAnalyzer(BaseAnalyzer):
     """
     Class for analyzing lap times of a specific driver or a team
     """
-    def __init__(self, identifier: str, year: int, round_number: int, session_identifier: str) -> None:
-        super().__init__(identifier, year, round_number, session_identifier)
+    __slots__ = ('laps', '_clean_lap_times', '_summary')
+
+    def __init__(self, identifier: str, year: int, round_number: int, session_identifier: str,
+                 load_kwargs: Optional[dict] = None) -> None:
+        super().__init__(identifier, year, round_number, session_identifier, load_kwargs)
         self.laps: Optional[pd.DataFrame] = None
+        self._clean_lap_times: Optional[np.ndarray] = None
+        self._summary: Optional[dict] = None
 
 
     def load_data(self) -> None:
@@ -33,14 +37,87 @@ class TimeBasedAnalyzer(BaseAnalyzer):
         Loads lap time data for the driver or team.
         """
         super().load_session()
+        self._clean_lap_times = None
+        self._summary = None
         logger.info(f"Loading lap times for {self.identifier}")
 
-    def get_lap_times_dropna(self) -> pd.Series:
+    @staticmethod
+    def _to_seconds(lap_times: pd.Series) -> np.ndarray:
+        """
+        Converts a timedelta Series to float seconds through the int64
+        nanosecond view, avoiding the per-element .dt accessor path.
+        :param lap_times: Series of timedelta64[ns] lap times
+        :return: Array of lap times in seconds, with NaT mapped to NaN
+        """
+        nanos = lap_times.to_numpy().view('i8')
+        seconds = nanos.astype(np.float64) / 1e9
+        seconds[nanos == np.iinfo(np.int64).min] = np.nan  # NaT sentinel
+        return seconds
+
+    def _set_laps(self, laps: pd.DataFrame) -> None:
+        """
+        Stores the loaded laps with a LapTimeSec float column materialized
+        once, so no downstream method re-converts the timedelta column, and
+        resets the caches derived from the previous laps.
+        :param laps: Laps of the analyzed driver or team
+        """
+        self.laps = laps.assign(LapTimeSec=self._to_seconds(laps['LapTime']))
+        self._clean_lap_times = None
+        self._summary = None
+
+    def _lap_seconds(self) -> np.ndarray:
+        """
+        :return: Lap times in seconds, read from the precomputed LapTimeSec
+            column when present (laps set through _set_laps), converted otherwise
+        """
+        if 'LapTimeSec' in self.laps.columns:
+            return self.laps['LapTimeSec'].to_numpy()
+        return self._to_seconds(self.laps['LapTime'])
+
+    def get_lap_times_dropna(self) -> np.ndarray:
+        """
+
+        :return: Clean lap times (without any nan values)
+        """
+        seconds = self._lap_seconds()
+        return seconds[~np.isnan(seconds)]
+
+    def _get_clean_lap_times(self) -> np.ndarray:
         """
+        Lazily computes and caches the outlier-filtered lap times in seconds,
+        so repeated aggregations do not re-traverse the LapTime column.
+        :return: Cached array of lap times with NaNs and outliers removed
+        """
+        if self._clean_lap_times is None:
+            self._clean_lap_times = self.filter_lap_outliers(self.get_lap_times_dropna())
+        return self._clean_lap_times
+
+    DEFAULT_PERCENTILES = [25, 50, 75]
 
-        :return: Clean lap times (without any nan values
+    def _summary_stats(self) -> dict:
+        """
+        Computes median, variance and the default percentiles of the cleaned
+        lap times in one pass over a single sorted copy, caching the result
+        so analyze() and the per-statistic methods share it.
+        :return: Dictionary with 'median', 'variance' and 'percentiles' keys
         """
-        return self.laps['LapTime'].dropna().dt.total_seconds()
+        if self._summary is None:
+            arr = self._get_clean_lap_times()
+            if arr.size == 0:
+                self._summary = {
+                    "median": np.nan,
+                    "variance": np.nan,
+                    "percentiles": {p: np.nan for p in self.DEFAULT_PERCENTILES}
+                }
+            else:
+                sorted_times = np.sort(arr)
+                percentile_values = np.percentile(sorted_times, self.DEFAULT_PERCENTILES)
+                self._summary = {
+                    "median": float(percentile_values[1]),
+                    "variance": float(np.var(sorted_times, ddof=1)),
+                    "percentiles": dict(zip(self.DEFAULT_PERCENTILES, percentile_values.tolist()))
+                }
+        return self._summary
 
     @abstractmethod
     def compare_lap_times(self, other: str, stint: int = None):
@@ -57,10 +134,7 @@ class TimeBasedAnalyzer(BaseAnalyzer):
         Calculates variance of lap time, lower variance means more consistent laps
         :return: Varience of lap times
         """
-        lap_times = self.get_lap_times_dropna()
-        filtered_lap_times = self.filter_lap_outliers(lap_times)
-        filtered_lap_times = pd.Series(filtered_lap_times)
-        return filtered_lap_times.var()
+        return self._summary_stats()["variance"]
 
     def calculate_lap_times_percentile(self, percentile: list = [25, 50, 75]) -> dict:
         """
@@ -68,10 +142,10 @@ class TimeBasedAnalyzer(BaseAnalyzer):
         :param percentile: list of percentiles to calculate, default is 25, 50, 75
         :return: Dictionary of selected percentile and its value
         """
-        lap_times = self.get_lap_times_dropna()
-        filtered_lap_times = self.filter_lap_outliers(lap_times)
-        filtered_lap_times = pd.Series(filtered_lap_times)
-        percentile_values = {p: np.percentile(filtered_lap_times, p) for p in percentile}
+        if percentile == self.DEFAULT_PERCENTILES:
+            return dict(self._summary_stats()["percentiles"])
+        filtered_lap_times = self._get_clean_lap_times()
+        percentile_values = dict(zip(percentile, np.percentile(filtered_lap_times, percentile).tolist()))
         return percentile_values
 
     def lap_time_progression(self) -> pd.DataFrame:
@@ -79,41 +153,64 @@ class TimeBasedAnalyzer(BaseAnalyzer):
         Calculates time differences between laps
         :return: DataFrame with lap number, lap times, time change by lap
         """
-        progression = self.laps[['LapNumber', 'LapTimes']].dropna()
-        progression['LapTimeSeconds'] = progression['LapTimes'].dt.total_seconds()
-        progression = progression.sort_values(by='LapNumber')
-        progression['TimeChange'] = progression['LapTimeSeconds'].diff()
-        return progression
+        lap_numbers = self.laps['LapNumber'].to_numpy()
+        lap_seconds = self._lap_seconds()
 
-    @staticmethod
-    def filter_lap_outliers(lap_times: pd.Series) -> list:
+        valid = ~np.isnan(lap_seconds)
+        order = np.argsort(lap_numbers[valid])
+        lap_numbers = lap_numbers[valid][order]
+        lap_seconds = lap_seconds[valid][order]
+
+        time_change = np.full_like(lap_seconds, np.nan)
+        if lap_seconds.size:
+            time_change[1:] = np.diff(lap_seconds)
+
+        return pd.DataFrame({
+            'LapNumber': lap_numbers,
+            'LapTimeSeconds': lap_seconds,
+            'TimeChange': time_change
+        })
+
+    # Adjust this multiplier for sensitivity
+    OUTLIER_THRESHOLD = 1.5
+    # Scales the median absolute deviation to the std of a normal distribution
+    _MAD_TO_STD = 1.4826
+
+    @classmethod
+    def filter_lap_outliers(cls, lap_times: pd.Series) -> np.ndarray:
         """
-        Filters out outlier lap times based on a threshold multiplier of standard deviation.
+        Filters out outlier lap times based on a threshold multiplier of the
+        median absolute deviation. Both the center and the scale are medians,
+        so slow in/out laps cannot inflate the acceptance window the way they
+        inflated the standard deviation.
         :param lap_times: Series of lap times in seconds
-        :return: List of lap times after filtering out outliers
+        :return: Array of lap times after filtering out outliers
         """
-        median_lap_time = np.median(lap_times)
-        threshold = 1.5  # Adjust this multiplier for sensitivity
-        return [time for time in lap_times if abs(time - median_lap_time) <= threshold * np.std(lap_times)]
+        arr = np.asarray(lap_times, dtype=np.float64)
+        if arr.size == 0:
+            return arr
+        delta = np.abs(arr - np.median(arr))
+        mad = np.median(delta)
+        return arr[delta <= cls.OUTLIER_THRESHOLD * cls._MAD_TO_STD * mad]
 
     def get_average_lap_time(self) -> float:
         """
         Calculates average lap time for team or driver, self.laps must be loaded first in child class
         :return: average lap time for team or driver
         """
-        lap_times = self.get_lap_times_dropna()
-        clean_lap_times = self.filter_lap_outliers(lap_times)
+        clean_lap_times = self._get_clean_lap_times()
 
-        if len(clean_lap_times) == 0:
+        if clean_lap_times.size == 0:
             logger.info(f"No valid lap times after filtering for {self.identifier} in {self.session.event['EventName']}")
-        else:
-            logger.info(f"Valid lap times for {self.identifier} in {self.session.event['EventName']}: {clean_lap_times}")
+            return np.nan
 
-        if clean_lap_times:
-            return np.median(clean_lap_times)
-        return np.nan
+        logger.info(f"Valid lap times for {self.identifier} in {self.session.event['EventName']}: {clean_lap_times}")
+        return self._summary_stats()["median"]
 
     def plot_lap_time_progression(self):
+        # Imported here so analyses that never plot don't pay matplotlib's import cost
+        import matplotlib.pyplot as plt
+
         progression = self.lap_time_progression()
         plt.figure(figsize=(10, 6))
         plt.plot(progression['LapNumber'], progression['LapTimeSeconds'], label='Lap Time (s)')
@@ -136,7 +233,10 @@ class TimeBasedAnalyzer(BaseAnalyzer):
         # Don't know how to tell mypy that self.laps is not "DataFrame | None", but it is actually "DataFrame"
         avg_lap_time = self.get_average_lap_time()
         lap_time_variance = self.calculate_lap_time_variance()
-        fastest_lap = self.laps['LapTime'].min().total_seconds()
+        # Fastest lap is taken before outlier filtering, a single quick lap is
+        # real even when the consistency stats exclude it.
+        lap_seconds = self._lap_seconds()
+        fastest_lap = float(np.nanmin(lap_seconds)) if lap_seconds.size else np.nan
 
         return {
             "identifier": self.identifier,
@@ -1,7 +1,37 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import fastf1
 from analyzers.driver_analyzer import DriverAnalyzer
+from analyzers._fastf1_setup import ensure_cache
+
+DRIVER_SESSIONS = [
+    ("VER", 2024, 1, 57),
+    ("NOR", 2024, 1, 57),
+    ("HAM", 2024, 2, 50)
+]
+
+
+@pytest.fixture(scope='session')
+def warm_session_cache():
+    """
+    Pre-warms the FastF1 on-disk cache for every (year, round) the tests use.
+    Loads run concurrently since session loading is I/O-bound, and duplicates
+    like the two 2024 round 1 entries are only fetched once.
+    """
+    ensure_cache()
 
-def test_driver_analyzer_basic():
+    def load(year, round_number):
+        session = fastf1.get_session(year, round_number, 'R')
+        session.load(laps=True, telemetry=False, weather=False, messages=False)
+
+    rounds = {(year, round_number) for _, year, round_number, _ in DRIVER_SESSIONS}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(load, year, round_number) for year, round_number in rounds]:
+            future.result()
+
+
+def test_driver_analyzer_basic(warm_session_cache):
     analyzer = DriverAnalyzer(driver_code="VER", year=2024, round_number=1)
     result = analyzer.analyze()
 
@@ -15,16 +45,12 @@ def test_driver_analyzer_basic():
     assert result["round"] == 1
     assert isinstance(result["laps_count"], int)
 
-@pytest.mark.parametrize("driver_code,year,round_number,expected_laps_count", [
-    ("VER", 2024, 1, 57),
-    ("NOR", 2024, 1, 57),
-    ("HAM", 2024, 2, 50)
-])
+@pytest.mark.parametrize("driver_code,year,round_number,expected_laps_count", DRIVER_SESSIONS)
 
-def test_mulptiple_drivers(driver_code, year, round_number, expected_laps_count):
+def test_mulptiple_drivers(warm_session_cache, driver_code, year, round_number, expected_laps_count):
     analyzer = DriverAnalyzer(driver_code=driver_code, year=year, round_number=round_number)
     result = analyzer.analyze()
     assert result["driver"] == driver_code
     assert result["year"] == year
     assert result["round"] == round_number
-    assert result["laps_count"] == expected_laps_count
\ No newline at end of file
+    assert result["laps_count"] == expected_laps_count
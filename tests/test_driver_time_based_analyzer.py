@@ -0,0 +1,45 @@
+import pytest
+import pandas as pd
+from unittest.mock import MagicMock
+from src.analyzers.driver_time_based_analyzer import DriverTimeBasedAnalyzer
+
+
+@pytest.fixture
+def driver_analyzer():
+    analyzer = DriverTimeBasedAnalyzer('VER', 2024, 1, 'R')
+    analyzer.session = MagicMock()
+    analyzer.session.laps = pd.DataFrame({
+        'Driver': ['VER'] * 3 + ['NOR'] * 3,
+        'LapNumber': [1, 2, 3, 1, 2, 4],
+        'Stint': [1, 1, 2, 1, 1, 2],
+        'LapTime': pd.to_timedelta([90, 91, 92, 89, 93, 94], unit='s')
+    })
+    analyzer._set_laps(analyzer._laps_for_driver('VER'))
+    return analyzer
+
+
+def test_compare_lap_times_aligns_on_lap_number(driver_analyzer: DriverTimeBasedAnalyzer):
+    comparison = driver_analyzer.compare_lap_times(other_driver='NOR')
+    assert list(comparison['LapNumber']) == [1, 2], "Only laps both drivers completed should be compared"
+    assert list(comparison['LapTimeDifference']) == [1.0, -2.0]
+
+
+def test_compare_lap_times_does_not_mutate_laps(driver_analyzer: DriverTimeBasedAnalyzer):
+    laps_before = len(driver_analyzer.laps)
+    driver_analyzer.compare_lap_times(other_driver='NOR', stint=1)
+    assert len(driver_analyzer.laps) == laps_before, "compare_lap_times must not filter self.laps in place"
+
+
+def test_lap_time_progression(driver_analyzer: DriverTimeBasedAnalyzer):
+    progression = driver_analyzer.lap_time_progression()
+    assert list(progression['LapNumber']) == [1, 2, 3]
+    assert list(progression['TimeChange'])[1:] == [1.0, 1.0]
+
+
+def test_analyze_all(driver_analyzer: DriverTimeBasedAnalyzer, monkeypatch):
+    monkeypatch.setattr('src.analyzers.driver_time_based_analyzer._get_loaded_session',
+                        lambda *args: driver_analyzer.session)
+    results = DriverTimeBasedAnalyzer.analyze_all(2024, 1, 'R')
+    assert set(results) == {'VER', 'NOR'}
+    assert results['VER']['fastest_lap'] == 90.0
+    assert results['NOR']['round'] == 1